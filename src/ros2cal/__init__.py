@@ -1,7 +1,15 @@
 """Roster conversion toolkit."""
 
 from .cli import roster_image_to_ics
-from .ics import DEFAULT_LOCAL_TZ, json_to_ics
-from .ocr import RosterParser
+from .ics import DEFAULT_LOCAL_TZ, json_to_ics, write_ics
+from .ocr import CallUsage, RosterParseResult, RosterParser
 
-__all__ = ["RosterParser", "json_to_ics", "DEFAULT_LOCAL_TZ", "roster_image_to_ics"]
+__all__ = [
+    "RosterParser",
+    "RosterParseResult",
+    "CallUsage",
+    "json_to_ics",
+    "write_ics",
+    "DEFAULT_LOCAL_TZ",
+    "roster_image_to_ics",
+]
@@ -3,12 +3,32 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
+import sys
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
-from .ics import DEFAULT_LOCAL_TZ, json_to_ics
-from .ocr import CallUsage, RosterParseResult, RosterParser
+from .files import atomic_writer
+from .ics import DEFAULT_LOCAL_TZ, write_ics
+from .ocr import DEFAULT_MAX_CONCURRENCY, IMAGE_MIME_TYPES, CallUsage, RosterParseResult, RosterParser
+
+
+def _write_outputs(
+    roster_json: dict,
+    *,
+    ics_output: Path,
+    json_output: Optional[Path],
+    calendar_name: str,
+    local_tz: str,
+) -> None:
+    if json_output:
+        with atomic_writer(json_output) as fp:
+            fp.write(json.dumps(roster_json, ensure_ascii=False, indent=2))
+
+    with atomic_writer(ics_output) as fp:
+        write_ics(roster_json, fp, calendar_name=calendar_name, local_tz=local_tz)
 
 
 def roster_image_to_ics(
@@ -18,41 +38,106 @@ def roster_image_to_ics(
     json_output: Optional[Path] = None,
     calendar_name: str = "Roster",
     local_tz: str = DEFAULT_LOCAL_TZ,
+    use_cache: bool = True,
+    fused: bool = True,
 ) -> tuple[Path, RosterParseResult]:
-    """Run the full pipeline: JPG -> OCR -> JSON -> ICS."""
-    parser = RosterParser()
-    result = parser.parse_image(image_path)
-    roster_json = result.data
+    """Run the full pipeline: JPG -> OCR -> JSON -> ICS.
+
+    By default OCR and parsing happen in one OpenAI call; ``fused=False`` uses the two-stage flow.
+    """
+    parser = RosterParser(use_cache=use_cache)
+    result = parser.parse_image_fused(image_path) if fused else parser.parse_image(image_path)
+    _write_outputs(
+        result.data,
+        ics_output=ics_output,
+        json_output=json_output,
+        calendar_name=calendar_name,
+        local_tz=local_tz,
+    )
+    return ics_output, result
 
-    if json_output:
-        json_output.parent.mkdir(parents=True, exist_ok=True)
-        json_output.write_text(
-            json.dumps(roster_json, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-            newline="\n",
-        )
 
-    ics_content = json_to_ics(roster_json, calendar_name=calendar_name, local_tz=local_tz)
-    ics_output.parent.mkdir(parents=True, exist_ok=True)
-    ics_output.write_text(ics_content, encoding="utf-8", newline="\n")
-    return ics_output, result
+def find_roster_images(directory: Path) -> list[Path]:
+    """Return roster images in a directory, skipping our own *_processed files."""
+    return sorted(
+        path
+        for path in directory.iterdir()
+        if path.is_file()
+        and path.suffix.lower() in IMAGE_MIME_TYPES
+        and not path.stem.endswith("_processed")
+    )
+
+
+def _batch_output_path(image_path: Path, out_dir: Optional[Path], suffix: str, keep_source_suffix: bool) -> Path:
+    # roster.jpg and roster.png in one batch would both map to roster.ics; keep the
+    # source suffix (roster.jpg.ics) for such colliding stems.
+    name = f"{image_path.name}{suffix}" if keep_source_suffix else f"{image_path.stem}{suffix}"
+    return (out_dir or image_path.parent) / name
+
+
+def roster_images_to_ics(
+    image_paths: list[Path],
+    *,
+    ics_dir: Optional[Path] = None,
+    json_dir: Optional[Path] = None,
+    calendar_name: str = "Roster",
+    local_tz: str = DEFAULT_LOCAL_TZ,
+    use_cache: bool = True,
+    fused: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> tuple[list[tuple[Path, RosterParseResult]], list[tuple[Path, Exception]]]:
+    """Run the pipeline for several images, overlapping their OpenAI calls.
+
+    Returns ``(outputs, failures)``: images that succeeded are written even when others fail.
+    """
+    parser = RosterParser(use_cache=use_cache)
+    results = asyncio.run(parser.parse_images(image_paths, fused=fused, max_concurrency=max_concurrency))
+
+    stem_counts = Counter(path.stem for path in image_paths)
+    outputs: list[tuple[Path, RosterParseResult]] = []
+    failures: list[tuple[Path, Exception]] = []
+    for image_path, result in zip(image_paths, results):
+        if isinstance(result, Exception):
+            failures.append((image_path, result))
+            continue
+
+        collides = stem_counts[image_path.stem] > 1
+        ics_output = _batch_output_path(image_path, ics_dir, ".ics", collides)
+        json_output = _batch_output_path(image_path, json_dir, ".json", collides) if json_dir else None
+        try:
+            _write_outputs(
+                result.data,
+                ics_output=ics_output,
+                json_output=json_output,
+                calendar_name=calendar_name,
+                local_tz=local_tz,
+            )
+        except Exception as exc:
+            failures.append((image_path, exc))
+            continue
+        outputs.append((ics_output, result))
+    return outputs, failures
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Convert an airline roster JPG into an ICS calendar file.",
     )
-    parser.add_argument("image", type=Path, help="Path to a roster image (jpg/jpeg/png).")
+    parser.add_argument(
+        "image",
+        type=Path,
+        help="Path to a roster image (jpg/jpeg/png), or a directory of images to process concurrently.",
+    )
     parser.add_argument(
         "-o",
         "--ics-output",
         type=Path,
-        help="Where to write the resulting .ics file (defaults to <image>.ics).",
+        help="Where to write the resulting .ics file (defaults to <image>.ics); a directory for batch input.",
     )
     parser.add_argument(
         "--json-output",
         type=Path,
-        help="Optional path to save the intermediate roster JSON.",
+        help="Optional path to save the intermediate roster JSON; a directory for batch input.",
     )
     parser.add_argument(
         "--calendar-name",
@@ -64,9 +149,42 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=DEFAULT_LOCAL_TZ,
         help=f"Local timezone used for human-readable descriptions (default: {DEFAULT_LOCAL_TZ}).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call OpenAI instead of reusing cached OCR/parse responses (fresh responses are still cached).",
+    )
+    parser.add_argument(
+        "--two-stage",
+        action="store_true",
+        help="Run OCR and parsing as two separate OpenAI calls (slower; useful for debugging).",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Directory input: max images processed at once (default: {DEFAULT_MAX_CONCURRENCY}).",
+    )
     return parser
 
 
+def _fmt_usage(label: str, usage: CallUsage) -> str:
+    cached_flag = "cached" if usage.cached_input_tokens else "normal"
+    return (
+        f"{label}: input={usage.input_tokens} (cached={usage.cached_input_tokens}, {cached_flag}), "
+        f"output={usage.output_tokens}, total={usage.effective_total}"
+    )
+
+
+def _print_usage(result: RosterParseResult) -> None:
+    print("OpenAI token usage:")
+    if result.fused:
+        print(f"- {_fmt_usage('OCR+Parse', result.parse_usage)}")
+        return
+    print(f"- {_fmt_usage('OCR', result.ocr_usage)}")
+    print(f"- {_fmt_usage('Parse', result.parse_usage)}")
+
+
 def main(argv: Optional[list[str]] = None) -> None:
     parser = build_arg_parser()
     args = parser.parse_args(argv)
@@ -75,6 +193,33 @@ def main(argv: Optional[list[str]] = None) -> None:
     if not image_path.exists():
         parser.error(f"Image not found: {image_path}")
 
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
+
+    if image_path.is_dir():
+        image_paths = find_roster_images(image_path)
+        if not image_paths:
+            parser.error(f"No roster images found in: {image_path}")
+
+        outputs, failures = roster_images_to_ics(
+            image_paths,
+            ics_dir=args.ics_output,
+            json_dir=args.json_output,
+            calendar_name=args.calendar_name,
+            local_tz=args.local_tz,
+            use_cache=not args.no_cache,
+            fused=not args.two_stage,
+            max_concurrency=args.max_concurrency,
+        )
+        for ics_path, result in outputs:
+            print(f"ICS saved to: {ics_path}")
+            _print_usage(result)
+        if failures:
+            for failed_path, exc in failures:
+                print(f"Failed: {failed_path}: {type(exc).__name__}: {exc}", file=sys.stderr)
+            raise SystemExit(1)
+        return
+
     ics_output = args.ics_output or image_path.with_suffix(".ics")
 
     ics_path, result = roster_image_to_ics(
@@ -83,19 +228,11 @@ def main(argv: Optional[list[str]] = None) -> None:
         json_output=args.json_output,
         calendar_name=args.calendar_name,
         local_tz=args.local_tz,
+        use_cache=not args.no_cache,
+        fused=not args.two_stage,
     )
     print(f"ICS saved to: {ics_path}")
-
-    def fmt_usage(label: str, usage: CallUsage) -> str:
-        cached_flag = "cached" if usage.cached_input_tokens else "normal"
-        return (
-            f"{label}: input={usage.input_tokens} (cached={usage.cached_input_tokens}, {cached_flag}), "
-            f"output={usage.output_tokens}, total={usage.effective_total}"
-        )
-
-    print("OpenAI token usage:")
-    print(f"- {fmt_usage('OCR', result.ocr_usage)}")
-    print(f"- {fmt_usage('Parse', result.parse_usage)}")
+    _print_usage(result)
 
 
 if __name__ == "__main__":
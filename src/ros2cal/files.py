@@ -0,0 +1,26 @@
+"""Filesystem helpers shared by the CLI and the response cache."""
+
+from __future__ import annotations
+
+import os
+import secrets
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, TextIO
+
+
+@contextmanager
+def atomic_writer(path: Path, *, encoding: str = "utf-8", newline: str = "\n") -> Iterator[TextIO]:
+    """Write to a temp file next to ``path`` and move it into place only on success.
+
+    A failure (or Ctrl-C) mid-write leaves any previous ``path`` untouched.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with tmp_path.open("x", encoding=encoding, newline=newline) as fp:
+            yield fp
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
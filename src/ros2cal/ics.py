@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List
+import io
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, TextIO
 from zoneinfo import ZoneInfo
 
 DEFAULT_LOCAL_TZ = "Europe/Berlin"
+ICS_LINE_LIMIT = 75
 
 COLOR_MAP = {
     "FLIGHT": "#4285F4",
@@ -15,59 +18,142 @@ COLOR_MAP = {
     "A/L": "#0F9D58",
 }
 
+_LEG_TIME_KEYS = ("departure_time_utc", "arrival_time_utc", "start_time_utc", "end_time_utc")
 
+_COLOR_LINES = {duty_type: f"COLOR:{color}" for duty_type, color in COLOR_MAP.items()}
+
+
+@lru_cache(maxsize=8)
+def _zoneinfo(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=1024)
 def _parse_iso_utc(value: str) -> datetime:
+    # Fast path for the canonical "YYYY-MM-DDTHH:MM:SSZ" shape emitted by the parser.
+    if (
+        len(value) == 20
+        and value[-1] == "Z"
+        and value[10] == "T"
+        and value[4] == value[7] == "-"
+        and value[13] == value[16] == ":"
+        and value.isascii()
+        # int() tolerates signs and spaces; require plain digits so misreads still fail.
+        and (value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]).isdigit()
+    ):
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=timezone.utc,
+        )
     if value.endswith("Z"):
         value = value.replace("Z", "+00:00")
     return datetime.fromisoformat(value).astimezone(timezone.utc)
 
 
 def _format_dt_for_ics(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}Z"
+
+
+def _format_date_for_ics(value: date) -> str:
+    return f"{value.year:04d}{value.month:02d}{value.day:02d}"
 
 
 def _format_time_z(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).strftime("%H:%M") + "z"
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return f"{dt.hour:02d}:{dt.minute:02d}z"
+
+
+@lru_cache(maxsize=1024)
+def _format_time_z_str(value: str) -> str:
+    return _format_time_z(_parse_iso_utc(value))
 
 
-def _format_time_lt(dt: datetime, local_tz: str) -> str:
-    local = dt.astimezone(ZoneInfo(local_tz))
-    return local.strftime("%H:%M") + " LT"
+def _format_time_lt(dt: datetime, local_tz: ZoneInfo) -> str:
+    local = dt.astimezone(local_tz)
+    return f"{local.hour:02d}:{local.minute:02d} LT"
 
 
 def _escape_ics_text(text: str | None) -> str:
     if text is None:
         return ""
+    # Chained str.replace benchmarks faster here than str.translate or re.sub:
+    # each call is a single C-level scan and descriptions hold only a few escapables.
     text = text.replace("\\", "\\\\").replace(",", "\\,").replace(";", "\\;")
     return text.replace("\n", "\\n")
 
 
-def _build_description(event: Dict[str, Any], local_tz: str) -> str:
+def _rendered_legs(event: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the flights/activities that _build_description shows for this event."""
+    duty_type = event.get("duty_type", "")
+    if duty_type in ("FLIGHT", "DH"):
+        return event.get("flights") or []
+    if duty_type in ("HSBY", "A/L"):
+        return []
+    return event.get("activities") or []
+
+
+def _build_time_tables(
+    events: Iterable[Dict[str, Any]],
+    local_tz: ZoneInfo,
+) -> tuple[Dict[str, str], Dict[str, str]]:
+    """Format each distinct timestamp once: z-time for all, local time for duty boundaries."""
+    boundaries: set[str] = set()
+    leg_times: set[str] = set()
+    for event in events:
+        boundaries.add(event["start_utc"])
+        boundaries.add(event["end_utc"])
+        for leg in _rendered_legs(event):
+            for key in _LEG_TIME_KEYS:
+                value = leg.get(key)
+                if value is not None:
+                    leg_times.add(value)
+
+    z_times = {value: _format_time_z_str(value) for value in boundaries | leg_times}
+    lt_times = {value: _format_time_lt(_parse_iso_utc(value), local_tz) for value in boundaries}
+    return z_times, lt_times
+
+
+def _flight_line(flight: Dict[str, Any], z_times: Dict[str, str]) -> str:
+    return (
+        f"{flight.get('flight_number') or 'UNKNOWN'} "
+        f"{flight.get('departure_airport') or '???'} {z_times[flight['departure_time_utc']]} "
+        f"{flight.get('arrival_airport') or '???'} {z_times[flight['arrival_time_utc']]}"
+    )
+
+
+def _activity_line(activity: Dict[str, Any], z_times: Dict[str, str]) -> str:
+    return (
+        f"{activity.get('start_place') or '???'} {z_times[activity['start_time_utc']]} -> "
+        f"{activity.get('end_place') or '???'} {z_times[activity['end_time_utc']]}"
+    )
+
+
+def _build_description(
+    event: Dict[str, Any],
+    z_times: Dict[str, str],
+    lt_times: Dict[str, str],
+) -> str:
     duty_type = event.get("duty_type", "")
-    start_dt = _parse_iso_utc(event["start_utc"])
-    end_dt = _parse_iso_utc(event["end_utc"])
 
-    checkin_z = _format_time_z(start_dt)
-    checkout_z = _format_time_z(end_dt)
-    checkin_lt = _format_time_lt(start_dt, local_tz)
-    checkout_lt = _format_time_lt(end_dt, local_tz)
+    checkin_z = z_times[event["start_utc"]]
+    checkout_z = z_times[event["end_utc"]]
+    checkin_lt = lt_times[event["start_utc"]]
+    checkout_lt = lt_times[event["end_utc"]]
 
     lines: List[str] = []
 
     if duty_type in ("FLIGHT", "DH"):
         lines.append(f"CHECK-IN {checkin_z} ({checkin_lt})")
 
-        for flight in event.get("flights") or []:
-            fn = flight.get("flight_number") or "UNKNOWN"
-            dep_ap = flight.get("departure_airport") or "???"
-            arr_ap = flight.get("arrival_airport") or "???"
-
-            dep_dt = _parse_iso_utc(flight["departure_time_utc"])
-            arr_dt = _parse_iso_utc(flight["arrival_time_utc"])
-            dep_t = _format_time_z(dep_dt)
-            arr_t = _format_time_z(arr_dt)
-
-            lines.append(f"{fn} {dep_ap} {dep_t} {arr_ap} {arr_t}")
+        lines.extend(_flight_line(flight, z_times) for flight in _rendered_legs(event))
 
         lines.append(f"CHECK-OUT {checkout_z} ({checkout_lt})")
 
@@ -85,23 +171,41 @@ def _build_description(event: Dict[str, Any], local_tz: str) -> str:
         lines.append(f"Duty: {duty_type}")
         lines.append(f"CHECK-IN {checkin_z} ({checkin_lt})")
 
-        for activity in event.get("activities") or []:
-            start_place = activity.get("start_place") or "???"
-            end_place = activity.get("end_place") or "???"
-
-            start_dt_activity = _parse_iso_utc(activity["start_time_utc"])
-            end_dt_activity = _parse_iso_utc(activity["end_time_utc"])
-            start_t = _format_time_z(start_dt_activity)
-            end_t = _format_time_z(end_dt_activity)
-
-            lines.append(f"{start_place} {start_t} -> {end_place} {end_t}")
+        lines.extend(_activity_line(activity, z_times) for activity in _rendered_legs(event))
 
         lines.append(f"CHECK-OUT {checkout_z} ({checkout_lt})")
 
     return "\n".join(lines)
 
 
-def _event_to_ics(event: Dict[str, Any], local_tz: str, calendar_name: str) -> str:
+def _fold_line(line: str) -> str:
+    """Fold a content line into 75-octet chunks as required by RFC 5545."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= ICS_LINE_LIMIT:
+        return line
+
+    chunks: List[str] = []
+    start = 0
+    limit = ICS_LINE_LIMIT
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Never split inside a multi-byte UTF-8 sequence.
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        chunks.append(encoded[start:end].decode("utf-8"))
+        start = end
+        # Continuation lines start with a space, which counts toward the limit.
+        limit = ICS_LINE_LIMIT - 1
+    return "\r\n ".join(chunks)
+
+
+def _iter_event_lines(
+    event: Dict[str, Any],
+    *,
+    z_times: Dict[str, str],
+    lt_times: Dict[str, str],
+    dtstamp_line: str,
+) -> Iterator[str]:
     duty_type = event.get("duty_type", "DUTY")
     summary = _escape_ics_text(duty_type)
 
@@ -109,29 +213,71 @@ def _event_to_ics(event: Dict[str, Any], local_tz: str, calendar_name: str) -> s
     end_dt = _parse_iso_utc(event["end_utc"])
     uid = f"{duty_type}|{event['start_utc']}|{event['end_utc']}"
 
-    description_esc = _escape_ics_text(_build_description(event, local_tz))
-    dtstamp = _format_dt_for_ics(datetime.now(timezone.utc))
+    description_esc = _escape_ics_text(_build_description(event, z_times, lt_times))
 
-    color = COLOR_MAP.get(duty_type)
+    color_line = _COLOR_LINES.get(duty_type)
 
-    lines: List[str] = ["BEGIN:VEVENT", f"UID:{uid}", f"DTSTAMP:{dtstamp}"]
+    yield "BEGIN:VEVENT"
+    yield f"UID:{uid}"
+    yield dtstamp_line
 
     is_all_day = event.get("is_all_day", False) or duty_type == "A/L"
     if is_all_day:
         start_date = start_dt.date()
         end_date = start_date + timedelta(days=1)
-        lines.append(f"DTSTART;VALUE=DATE:{start_date.strftime('%Y%m%d')}")
-        lines.append(f"DTEND;VALUE=DATE:{end_date.strftime('%Y%m%d')}")
+        yield f"DTSTART;VALUE=DATE:{_format_date_for_ics(start_date)}"
+        yield f"DTEND;VALUE=DATE:{_format_date_for_ics(end_date)}"
     else:
-        lines.append(f"DTSTART:{_format_dt_for_ics(start_dt)}")
-        lines.append(f"DTEND:{_format_dt_for_ics(end_dt)}")
+        yield f"DTSTART:{_format_dt_for_ics(start_dt)}"
+        yield f"DTEND:{_format_dt_for_ics(end_dt)}"
 
-    lines.append(f"SUMMARY:{summary}")
-    lines.append(f"DESCRIPTION:{description_esc}")
-    if color:
-        lines.append(f"COLOR:{color}")
-    lines.append("END:VEVENT")
-    return "\r\n".join(lines)
+    yield f"SUMMARY:{summary}"
+    yield f"DESCRIPTION:{description_esc}"
+    if color_line:
+        yield color_line
+    yield "END:VEVENT"
+
+
+@lru_cache(maxsize=8)
+def _calendar_header(calendar_name: str) -> tuple[str, ...]:
+    return (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{calendar_name}//RosterToICS//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+    )
+
+
+def _iter_calendar_lines(
+    roster: Dict[str, Any],
+    *,
+    calendar_name: str,
+    local_tz: str,
+) -> Iterator[str]:
+    events: List[Dict[str, Any]] = list(roster.get("events", []))
+    z_times, lt_times = _build_time_tables(events, _zoneinfo(local_tz))
+    yield from _calendar_header(calendar_name)
+    dtstamp_line = f"DTSTAMP:{_format_dt_for_ics(datetime.now(timezone.utc))}"
+    for event in events:
+        yield from _iter_event_lines(event, z_times=z_times, lt_times=lt_times, dtstamp_line=dtstamp_line)
+    yield "END:VCALENDAR"
+
+
+def write_ics(
+    roster: Dict[str, Any],
+    fp: TextIO,
+    *,
+    calendar_name: str = "Roster",
+    local_tz: str = DEFAULT_LOCAL_TZ,
+) -> None:
+    """Stream the roster as ICS into a text file opened without newline translation.
+
+    Every content line is folded to 75 octets on the way out, as RFC 5545 requires.
+    """
+    for line in _iter_calendar_lines(roster, calendar_name=calendar_name, local_tz=local_tz):
+        fp.write(_fold_line(line))
+        fp.write("\r\n")
 
 
 def json_to_ics(
@@ -140,14 +286,6 @@ def json_to_ics(
     calendar_name: str = "Roster",
     local_tz: str = DEFAULT_LOCAL_TZ,
 ) -> str:
-    events: Iterable[Dict[str, Any]] = roster.get("events", [])
-    header = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        f"PRODID:-//{calendar_name}//RosterToICS//EN",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-    ]
-    body = [_event_to_ics(event, local_tz, calendar_name) for event in events]
-    footer = ["END:VCALENDAR"]
-    return "\r\n".join(header + body + footer)
+    buffer = io.StringIO(newline="")
+    write_ics(roster, buffer, calendar_name=calendar_name, local_tz=local_tz)
+    return buffer.getvalue()
@@ -2,20 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import json
+import mmap
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, TypeVar
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from PIL import Image
 
-from .prompts import SYSTEM_PROMPT_OCR, SYSTEM_PROMPT_PARSE
+from .files import atomic_writer
+from .prompts import SYSTEM_PROMPT_OCR, SYSTEM_PROMPT_OCR_AND_PARSE, SYSTEM_PROMPT_PARSE
 
+IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+JPEG_SUFFIXES = (".jpg", ".jpeg")
 
-@dataclass
+DEFAULT_MAX_CONCURRENCY = 4
+
+T = TypeVar("T")
+
+CACHE_DIR_ENV = "ROS2CAL_CACHE_DIR"
+DEFAULT_CACHE_DIR = "~/.cache/ros2cal"
+
+_dotenv_loaded = False
+_default_client: Optional[OpenAI] = None
+
+
+@dataclass(slots=True)
 class CallUsage:
     input_tokens: int = 0
     output_tokens: int = 0
@@ -31,27 +53,61 @@ class CallUsage:
         return (self.input_tokens or 0) + (self.output_tokens or 0)
 
 
-@dataclass
+@dataclass(slots=True)
 class RosterParseResult:
     data: Dict[str, Any]
     ocr_usage: CallUsage
     parse_usage: CallUsage
+    fused: bool = False
 
 
 def _encode_image(path: Path) -> str:
     with path.open("rb") as image_file:
-        return base64.b64encode(image_file.read()).decode("utf-8")
+        if path.stat().st_size == 0:
+            return ""
+        # Encode straight from the memory map to avoid an intermediate bytes copy.
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return base64.b64encode(mapped).decode("ascii")
+
+
+def default_cache_dir() -> Path:
+    """Return the response cache directory (``$ROS2CAL_CACHE_DIR`` or ``~/.cache/ros2cal``)."""
+    return Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)).expanduser()
+
+
+def _new_cache_hash(model: str, prompt: str) -> hashlib.blake2b:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model.encode("utf-8") + b"\0")
+    digest.update(prompt.encode("utf-8") + b"\0")
+    return digest
+
+
+def _image_mime_type(path: Path) -> str:
+    return IMAGE_MIME_TYPES.get(path.suffix.lower(), "image/png")
 
 
 def prepare_image_for_ocr(path: Path, scale: int = 2) -> Path:
-    """Ensure the image is large enough and saved as PNG for better OCR."""
-    img = Image.open(path)
-    if img.width < 1500:
-        img = img.resize((img.width * scale, img.height * scale), Image.LANCZOS)
-    img = img.convert("RGB")
-    out_path = path.with_suffix(path.suffix + "_processed.png")
-    img.save(out_path, format="PNG")
-    return out_path
+    """Ensure the image is large enough and saved as JPEG (PNG if it has alpha) for OCR."""
+    with Image.open(path) as img:
+        has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+        needs_resize = img.width < 1500
+        if not needs_resize and img.mode == "RGB" and path.suffix.lower() in JPEG_SUFFIXES:
+            return path
+
+        if needs_resize:
+            img = img.resize((img.width * scale, img.height * scale), Image.LANCZOS)
+        if has_alpha:
+            if img.mode != "RGBA":
+                img = img.convert("RGBA")
+            out_path = path.with_suffix(path.suffix + "_processed.png")
+            # The file is only base64-encoded for the API, so favour encode speed over size.
+            img.save(out_path, format="PNG", compress_level=1)
+        else:
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            out_path = path.with_suffix(path.suffix + "_processed.jpg")
+            img.save(out_path, format="JPEG", quality=92, optimize=False, subsampling=1)
+        return out_path
 
 
 class RosterParser:
@@ -62,11 +118,32 @@ class RosterParser:
         client: Optional[OpenAI] = None,
         ocr_model: str = "gpt-4.1",
         parse_model: str = "gpt-5.1",
+        aclient: Optional[AsyncOpenAI] = None,
+        use_cache: bool = True,
     ) -> None:
-        load_dotenv()
-        self.client = client or OpenAI()
+        global _dotenv_loaded, _default_client
+        if not _dotenv_loaded:
+            load_dotenv()
+            _dotenv_loaded = True
+        if client is None:
+            # Share one sync client (and its HTTP connection pool) across parsers.
+            if _default_client is None:
+                _default_client = OpenAI()
+            client = _default_client
+        self.client = client
+        self._aclient = aclient
         self.ocr_model = ocr_model
         self.parse_model = parse_model
+        # use_cache=False skips cache reads but still refreshes the stored entries.
+        self.cache_dir = default_cache_dir()
+        self.read_cache = use_cache
+
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async client, created on first use so sync-only callers never build it."""
+        if self._aclient is None:
+            self._aclient = AsyncOpenAI()
+        return self._aclient
 
     def _extract_usage(self, response: Any) -> CallUsage:
         """Best-effort extraction of token usage, handling both attr and dict styles."""
@@ -117,11 +194,87 @@ class RosterParser:
             total_tokens=total_tokens,
         )
 
-    def _ocr_image(self, image_path: Path) -> tuple[str, CallUsage]:
+    def _cache_load(self, key: str, suffix: str, decode: Callable[[str], T]) -> Optional[T]:
+        if not self.read_cache:
+            return None
+        path = self.cache_dir / f"{key}{suffix}"
+        try:
+            return decode(path.read_text(encoding="utf-8"))
+        except OSError:
+            return None
+        except ValueError:
+            # A corrupt entry (e.g. an older, non-atomic write cut mid-character or mid-JSON)
+            # is a miss; drop it. Covers both UnicodeDecodeError and JSONDecodeError.
+            path.unlink(missing_ok=True)
+            return None
+
+    def _cache_store(self, key: str, suffix: str, text: str) -> None:
+        try:
+            with atomic_writer(self.cache_dir / f"{key}{suffix}", newline="") as fp:
+                fp.write(text)
+        except OSError:
+            # The cache is an optimisation only; never fail a run because of it.
+            pass
+
+    def _cache_response(self, key: str, suffix: str, response: Any, decode: Callable[[str], T]) -> tuple[T, CallUsage]:
+        usage = self._extract_usage(response)
+        value = decode(response.output_text)
+        self._cache_store(key, suffix, response.output_text)
+        return value, usage
+
+    def _cached_call(
+        self,
+        key: str,
+        suffix: str,
+        call: Callable[[], Any],
+        decode: Callable[[str], T],
+    ) -> tuple[T, CallUsage]:
+        """Return the cached ``decode``d output for ``key``, or run ``call`` and cache its output."""
+        cached = self._cache_load(key, suffix, decode)
+        if cached is not None:
+            return cached, CallUsage()
+        return self._cache_response(key, suffix, call(), decode)
+
+    async def _cached_call_async(
+        self,
+        key: str,
+        suffix: str,
+        call: Callable[[], Awaitable[Any]],
+        decode: Callable[[str], T],
+    ) -> tuple[T, CallUsage]:
+        """Async variant of :meth:`_cached_call`."""
+        cached = self._cache_load(key, suffix, decode)
+        if cached is not None:
+            return cached, CallUsage()
+        return self._cache_response(key, suffix, await call(), decode)
+
+    def _prepare_ocr(self, image_path: Path) -> tuple[Path, str]:
+        return self._prepare_image(image_path, self.ocr_model, SYSTEM_PROMPT_OCR)
+
+    def _prepare_fused(self, image_path: Path) -> tuple[Path, str]:
+        return self._prepare_image(image_path, self.parse_model, SYSTEM_PROMPT_OCR_AND_PARSE)
+
+    def _prepare_image(self, image_path: Path, model: str, prompt: str) -> tuple[Path, str]:
+        """Prepare the image and return it with its content-addressed cache key."""
         prepared_path = prepare_image_for_ocr(image_path)
+        digest = _new_cache_hash(model, prompt)
+        with prepared_path.open("rb") as image_file:
+            for chunk in iter(lambda: image_file.read(1 << 16), b""):
+                digest.update(chunk)
+        return prepared_path, digest.hexdigest()
+
+    def _parse_cache_key(self, roster_text: str) -> str:
+        digest = _new_cache_hash(self.parse_model, SYSTEM_PROMPT_PARSE)
+        digest.update(roster_text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _image_input(self, prepared_path: Path) -> Dict[str, Any]:
         base64_image = _encode_image(prepared_path)
+        mime_type = _image_mime_type(prepared_path)
+        return {"type": "input_image", "image_url": f"data:{mime_type};base64,{base64_image}", "detail": "high"}
 
-        response = self.client.responses.create(
+    def _ocr_request(self, prepared_path: Path) -> Dict[str, Any]:
+        return dict(
             model=self.ocr_model,
             temperature=0,
             top_p=1,
@@ -131,16 +284,32 @@ class RosterParser:
                     "role": "user",
                     "content": [
                         {"type": "input_text", "text": "Transcribe the roster in this image exactly as text."},
-                        {"type": "input_image", "image_url": f"data:image/png;base64,{base64_image}", "detail": "high"},
+                        self._image_input(prepared_path),
                     ],
                 },
             ],
         )
-        usage = self._extract_usage(response)
-        return response.output_text, usage
 
-    def _parse_roster_text(self, roster_text: str) -> tuple[Dict[str, Any], CallUsage]:
-        response = self.client.responses.create(
+    def _fused_request(self, prepared_path: Path) -> Dict[str, Any]:
+        return dict(
+            model=self.parse_model,
+            temperature=0,
+            top_p=1,
+            text={"format": {"type": "json_object"}},
+            input=[
+                {"role": "system", "content": SYSTEM_PROMPT_OCR_AND_PARSE},
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "input_text", "text": "Convert the roster in this image to the canonical JSON."},
+                        self._image_input(prepared_path),
+                    ],
+                },
+            ],
+        )
+
+    def _parse_request(self, roster_text: str) -> Dict[str, Any]:
+        return dict(
             model=self.parse_model,
             temperature=0,
             top_p=1,
@@ -149,11 +318,99 @@ class RosterParser:
                 {"role": "user", "content": roster_text},
             ],
         )
-        usage = self._extract_usage(response)
-        return json.loads(response.output_text), usage
+
+    def _ocr_image(self, image_path: Path) -> tuple[str, CallUsage]:
+        prepared_path, key = self._prepare_ocr(image_path)
+        return self._cached_call(
+            key,
+            ".ocr.txt",
+            lambda: self.client.responses.create(**self._ocr_request(prepared_path)),
+            str,
+        )
+
+    def _parse_roster_text(self, roster_text: str) -> tuple[Dict[str, Any], CallUsage]:
+        return self._cached_call(
+            self._parse_cache_key(roster_text),
+            ".parsed.json",
+            lambda: self.client.responses.create(**self._parse_request(roster_text)),
+            json.loads,
+        )
+
+    async def _ocr_image_async(self, image_path: Path) -> tuple[str, CallUsage]:
+        # Image preparation is CPU-bound Pillow work; keep it off the event loop.
+        prepared_path, key = await asyncio.to_thread(self._prepare_ocr, image_path)
+
+        async def call() -> Any:
+            request = await asyncio.to_thread(self._ocr_request, prepared_path)
+            return await self.aclient.responses.create(**request)
+
+        return await self._cached_call_async(key, ".ocr.txt", call, str)
+
+    async def _parse_roster_text_async(self, roster_text: str) -> tuple[Dict[str, Any], CallUsage]:
+        return await self._cached_call_async(
+            self._parse_cache_key(roster_text),
+            ".parsed.json",
+            lambda: self.aclient.responses.create(**self._parse_request(roster_text)),
+            json.loads,
+        )
 
     def parse_image(self, image_path: Path) -> RosterParseResult:
         """Return roster JSON for an image path, with token usage for both calls."""
         ocr_text, ocr_usage = self._ocr_image(image_path)
         parsed_json, parse_usage = self._parse_roster_text(ocr_text)
         return RosterParseResult(data=parsed_json, ocr_usage=ocr_usage, parse_usage=parse_usage)
+
+    async def parse_image_async(self, image_path: Path) -> RosterParseResult:
+        """Async variant of :meth:`parse_image` using the ``AsyncOpenAI`` client."""
+        ocr_text, ocr_usage = await self._ocr_image_async(image_path)
+        parsed_json, parse_usage = await self._parse_roster_text_async(ocr_text)
+        return RosterParseResult(data=parsed_json, ocr_usage=ocr_usage, parse_usage=parse_usage)
+
+    def parse_image_fused(self, image_path: Path) -> RosterParseResult:
+        """Return roster JSON for an image path using a single combined OCR+parse call.
+
+        The two-stage :meth:`parse_image` remains available for debugging transcription issues.
+        """
+        prepared_path, key = self._prepare_fused(image_path)
+        parsed_json, usage = self._cached_call(
+            key,
+            ".fused.json",
+            lambda: self.client.responses.create(**self._fused_request(prepared_path)),
+            json.loads,
+        )
+        return RosterParseResult(data=parsed_json, ocr_usage=CallUsage(), parse_usage=usage, fused=True)
+
+    async def parse_image_fused_async(self, image_path: Path) -> RosterParseResult:
+        """Async variant of :meth:`parse_image_fused` using the ``AsyncOpenAI`` client."""
+        prepared_path, key = await asyncio.to_thread(self._prepare_fused, image_path)
+
+        async def call() -> Any:
+            request = await asyncio.to_thread(self._fused_request, prepared_path)
+            return await self.aclient.responses.create(**request)
+
+        parsed_json, usage = await self._cached_call_async(key, ".fused.json", call, json.loads)
+        return RosterParseResult(data=parsed_json, ocr_usage=CallUsage(), parse_usage=usage, fused=True)
+
+    async def parse_images(
+        self,
+        image_paths: Iterable[Path],
+        *,
+        fused: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[RosterParseResult | Exception]:
+        """Parse several images concurrently, returning results in input order.
+
+        At most ``max_concurrency`` images are in flight at once. A failing image yields its
+        exception in place of a result instead of aborting the whole batch.
+        """
+        parse = self.parse_image_fused_async if fused else self.parse_image_async
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(path: Path) -> RosterParseResult | Exception:
+            async with semaphore:
+                try:
+                    return await parse(path)
+                except Exception as exc:
+                    return exc
+
+        return list(await asyncio.gather(*(run(path) for path in image_paths)))
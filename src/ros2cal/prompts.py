@@ -18,15 +18,8 @@ Very important rules:
 - Output plain text only, no JSON, no explanations.
 """
 
-SYSTEM_PROMPT_PARSE = """
-You are a strict, deterministic converter for airline pilot rosters given as plain text.
-
-INPUT:
-- You receive plain text of a pilot roster (already extracted by OCR).
-- Treat this text as the single source of truth. Never change any digits or letters.
-- Your task is to convert this roster into a canonical JSON object.
-
-IMPORTANT:
+# Rules shared by every prompt that has to emit the canonical roster JSON.
+ROSTER_JSON_RULES = """IMPORTANT:
 - All times printed with "Z" are already UTC. Do NOT change, convert, round, or "fix" any time.
 - NEVER invent, adjust, or guess times, airports, flight numbers, or duty codes.
 - If a specific line or value is unreadable or ambiguous in the image, you may omit only that flight/activity entry instead of guessing.
@@ -256,3 +249,26 @@ OUTPUT FORMAT
   ]
 }
 """
+
+SYSTEM_PROMPT_PARSE = """
+You are a strict, deterministic converter for airline pilot rosters given as plain text.
+
+INPUT:
+- You receive plain text of a pilot roster (already extracted by OCR).
+- Treat this text as the single source of truth. Never change any digits or letters.
+- Your task is to convert this roster into a canonical JSON object.
+
+""" + ROSTER_JSON_RULES
+
+SYSTEM_PROMPT_OCR_AND_PARSE = """
+You are a strict, deterministic converter for airline pilot rosters given as an image.
+
+INPUT:
+- You receive an image of a pilot roster.
+- First read the roster exactly like an OCR engine: copy every visible character, number, and letter as it appears.
+- DO NOT interpret, DO NOT correct, DO NOT guess while reading. Keep the original row order.
+- Treat what you read as the single source of truth. Never change any digits or letters.
+- Then convert this roster into a canonical JSON object.
+- Output ONLY the final JSON object, never the transcription itself.
+
+""" + ROSTER_JSON_RULES
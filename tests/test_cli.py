@@ -0,0 +1,62 @@
+import asyncio
+import base64
+import io
+import json
+from types import SimpleNamespace
+
+from PIL import Image
+
+from ros2cal import cli
+from ros2cal.ocr import RosterParser
+
+ROSTER = {"events": [{"start_utc": "2025-12-18T04:30:00Z", "end_utc": "2025-12-18T16:00:00Z", "duty_type": "HSBY"}]}
+BAD_WIDTH = 150
+
+
+class FakeAsyncResponses:
+    """Replies with ROSTER, or invalid JSON for images that were BAD_WIDTH wide."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        image_url = kwargs["input"][1]["content"][1]["image_url"]
+        image = Image.open(io.BytesIO(base64.b64decode(image_url.split(",", 1)[1])))
+        output_text = "{not json" if image.width == BAD_WIDTH * 2 else json.dumps(ROSTER)
+        return SimpleNamespace(output_text=output_text, usage={})
+
+
+def test_batch_writes_successes_reports_failures_and_keeps_colliding_suffixes(tmp_path, monkeypatch):
+    monkeypatch.setenv("ROS2CAL_CACHE_DIR", str(tmp_path / "cache"))
+    responses = FakeAsyncResponses()
+    monkeypatch.setattr(
+        cli,
+        "RosterParser",
+        lambda **kwargs: RosterParser(client=object(), aclient=SimpleNamespace(responses=responses), **kwargs),
+    )
+
+    images = tmp_path / "in"
+    images.mkdir()
+    Image.new("RGB", (200, 100), "white").save(images / "roster.jpg")
+    Image.new("RGB", (200, 100), "white").save(images / "roster.png")
+    Image.new("RGB", (210, 100), "white").save(images / "other.jpg")
+    Image.new("RGB", (BAD_WIDTH, 100), "white").save(images / "bad.jpg")
+    out_dir = tmp_path / "out"
+
+    outputs, failures = cli.roster_images_to_ics(
+        cli.find_roster_images(images),
+        ics_dir=out_dir,
+        use_cache=False,
+        max_concurrency=2,
+    )
+
+    assert [(path.name, type(exc)) for path, exc in failures] == [("bad.jpg", json.JSONDecodeError)]
+    assert sorted(path.name for path, _ in outputs) == ["other.ics", "roster.jpg.ics", "roster.png.ics"]
+    assert sorted(path.name for path in out_dir.iterdir()) == ["other.ics", "roster.jpg.ics", "roster.png.ics"]
+    assert responses.max_in_flight == 2
@@ -0,0 +1,16 @@
+import pytest
+
+from ros2cal.files import atomic_writer
+
+
+def test_atomic_writer_keeps_previous_file_on_error(tmp_path):
+    target = tmp_path / "roster.ics"
+    target.write_text("previous", encoding="utf-8")
+
+    with pytest.raises(KeyError):
+        with atomic_writer(target) as fp:
+            fp.write("partial")
+            raise KeyError("departure_time_utc")
+
+    assert target.read_text(encoding="utf-8") == "previous"
+    assert list(tmp_path.iterdir()) == [target]
@@ -0,0 +1,111 @@
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from ros2cal.ics import ICS_LINE_LIMIT, _fold_line, _parse_iso_utc, json_to_ics
+
+DATA_DIR = Path(__file__).parent / "data"
+DTSTAMP_RE = re.compile(r"DTSTAMP:\d{8}T\d{6}Z")
+
+
+def _load_roster() -> dict:
+    return json.loads((DATA_DIR / "roster_20251213_cdm.json").read_text(encoding="utf-8"))
+
+
+def test_json_to_ics_matches_fixture():
+    expected = (DATA_DIR / "roster_20251213.ics").read_bytes().decode("utf-8")
+    actual = json_to_ics(_load_roster())
+    assert DTSTAMP_RE.sub("DTSTAMP:X", actual) == DTSTAMP_RE.sub("DTSTAMP:X", expected)
+
+
+def _long_duty_roster() -> dict:
+    return {
+        "events": [
+            {
+                "start_utc": "2025-12-22T04:30:00Z",
+                "end_utc": "2025-12-22T16:00:00Z",
+                "duty_type": "GROUND TRAINING / SIMULATOR CHECK – RECURRENT",
+            }
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    ("roster", "calendar_name"),
+    [
+        (_load_roster(), "Roster"),
+        (_long_duty_roster(), "Roster"),
+        (_long_duty_roster(), "A calendar name long enough to push PRODID past the octet limit"),
+    ],
+)
+def test_output_lines_fit_the_octet_limit(roster, calendar_name):
+    ics = json_to_ics(roster, calendar_name=calendar_name)
+    for line in ics.split("\r\n"):
+        assert len(line.encode("utf-8")) <= ICS_LINE_LIMIT
+    unfolded = ics.replace("\r\n ", "")
+    assert f"SUMMARY:{roster['events'][0]['duty_type']}" in unfolded
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "SUMMARY:short",
+        "DESCRIPTION:" + "CHECK-IN 07:30z (08:30 LT)\\n" * 10,
+        "DESCRIPTION:" + "04:30z – 16:00z " * 12,
+    ],
+)
+def test_fold_line_round_trips(line):
+    folded = _fold_line(line)
+    for physical in folded.split("\r\n"):
+        assert len(physical.encode("utf-8")) <= ICS_LINE_LIMIT
+    assert folded.replace("\r\n ", "") == line
+
+
+def test_unrendered_legs_are_not_parsed():
+    roster = {
+        "events": [
+            {
+                "start_utc": "2025-12-20T00:00:00Z",
+                "end_utc": "2025-12-21T00:00:00Z",
+                "duty_type": "A/L",
+                "activities": [{"start_time_utc": "not a time", "end_time_utc": "not a time"}],
+            },
+            {
+                "start_utc": "2025-12-22T04:30:00Z",
+                "end_utc": "2025-12-22T16:00:00Z",
+                "duty_type": "HSBY",
+                "flights": [{"departure_time_utc": "bad", "arrival_time_utc": "bad"}],
+            },
+        ]
+    }
+    ics = json_to_ics(roster)
+    assert "DESCRIPTION:Annual leave" in ics
+    assert "SUMMARY:HSBY" in ics
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-12-20T04:00:00Z",
+        "2024-02-29T23:59:59Z",
+        "2025-12-20T04:00Z",
+        "2025-12-20T05:00:00+01:00",
+        "2025-12-2 T04:00:00Z",
+        "2025-+1-20T04:00:00Z",
+        "2025/12/20T04:00:00Z",
+        "2025-12-20T04:0 :00Z",
+        "2025-13-20T04:00:00Z",
+        "２025-12-20T04:00:00Z",
+    ],
+)
+def test_parse_iso_utc_agrees_with_fromisoformat(value):
+    try:
+        expected = datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+    except ValueError:
+        with pytest.raises(ValueError):
+            _parse_iso_utc(value)
+    else:
+        assert _parse_iso_utc(value) == expected
@@ -0,0 +1,100 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from ros2cal.ocr import RosterParser
+
+ROSTER = {"events": [{"start_utc": "2025-12-18T04:30:00Z", "end_utc": "2025-12-18T16:00:00Z", "duty_type": "HSBY"}]}
+
+
+class FakeResponses:
+    def __init__(self, output_text: str) -> None:
+        self.output_text = output_text
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        usage = {"input_tokens": 10, "output_tokens": 20, "total_tokens": 30}
+        return SimpleNamespace(output_text=self.output_text, usage=usage)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv("ROS2CAL_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "roster.jpg"
+    Image.new("RGB", (200, 100), "white").save(path)
+    return path
+
+
+def _parser(responses: FakeResponses, **kwargs) -> RosterParser:
+    return RosterParser(client=SimpleNamespace(responses=responses), **kwargs)
+
+
+def test_cache_hit_skips_api_and_reports_zero_usage(cache_dir, image_path):
+    responses = FakeResponses(json.dumps(ROSTER))
+
+    first = _parser(responses).parse_image_fused(image_path)
+    second = _parser(responses).parse_image_fused(image_path)
+
+    assert responses.calls == 1
+    assert first.data == second.data == ROSTER
+    assert first.parse_usage.effective_total == 30
+    assert second.parse_usage.effective_total == 0
+    assert len(list(cache_dir.glob("*.fused.json"))) == 1
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        json.dumps(ROSTER).encode("utf-8")[:25],
+        # Cut inside a multi-byte UTF-8 character, as an interrupted write would.
+        '{"events": [{"duty_type": "é'.encode("utf-8")[:-1],
+    ],
+)
+def test_corrupt_cache_entry_is_a_miss_and_is_replaced(cache_dir, image_path, corrupt):
+    responses = FakeResponses(json.dumps(ROSTER))
+    _parser(responses).parse_image_fused(image_path)
+    (entry,) = cache_dir.glob("*.fused.json")
+    entry.write_bytes(corrupt)
+
+    result = _parser(responses).parse_image_fused(image_path)
+
+    assert responses.calls == 2
+    assert result.data == ROSTER
+    assert json.loads(entry.read_text(encoding="utf-8")) == ROSTER
+
+
+def test_no_cache_skips_reads_but_refreshes_entry(cache_dir, image_path):
+    _parser(FakeResponses(json.dumps({"events": []}))).parse_image_fused(image_path)
+
+    responses = FakeResponses(json.dumps(ROSTER))
+    result = _parser(responses, use_cache=False).parse_image_fused(image_path)
+
+    assert responses.calls == 1
+    assert result.data == ROSTER
+    (entry,) = cache_dir.glob("*.fused.json")
+    assert json.loads(entry.read_text(encoding="utf-8")) == ROSTER
+
+
+def test_two_stage_results_are_cached(cache_dir, image_path):
+    class TwoStageResponses(FakeResponses):
+        def create(self, **kwargs):
+            self.output_text = "HSBY 0430Z-1600Z" if kwargs["model"] == "gpt-4.1" else json.dumps(ROSTER)
+            return super().create(**kwargs)
+
+    responses = TwoStageResponses("")
+    _parser(responses).parse_image(image_path)
+    cached = _parser(responses).parse_image(image_path)
+
+    assert responses.calls == 2
+    assert cached.data == ROSTER
+    assert cached.ocr_usage.effective_total == cached.parse_usage.effective_total == 0
+    assert {p.name.split(".", 1)[1] for p in cache_dir.iterdir()} == {"ocr.txt", "parsed.json"}